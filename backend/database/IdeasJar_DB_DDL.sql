@@ -11,3 +11,10 @@ create index idx_ideas_created_at on ideas using btree (created_at);
 create index idx_ideas_priority on ideas using btree (priority);
 create index idx_ideas_content_search on ideas using gin ((to_tsvector('english'::regconfig));
 
+create table public.idea_daily_stats (
+  day date not null,
+  priority priority_enum not null,
+  is_voice boolean not null,
+  idea_count integer not null default 0,
+  primary key (day, priority, is_voice)
+);
@@ -15,6 +15,24 @@ CREATE INDEX idx_ideas_created_at ON ideas(created_at);
 CREATE INDEX idx_ideas_priority ON ideas(priority);
 CREATE INDEX idx_ideas_content_search ON ideas USING gin(to_tsvector('english', content));
 
+-- Create daily rollup table used by GET /stats/timeline
+CREATE TABLE idea_daily_stats (
+                       day DATE NOT NULL,
+                       priority priority_enum NOT NULL,
+                       is_voice BOOLEAN NOT NULL,
+                       idea_count INTEGER NOT NULL DEFAULT 0,
+                       PRIMARY KEY (day, priority, is_voice)
+);
+
+-- Backfill rollups from any existing ideas (same as POST /stats/rollups/rebuild)
+INSERT INTO idea_daily_stats (day, priority, is_voice, idea_count)
+SELECT (created_at AT TIME ZONE 'UTC')::date,
+       COALESCE(priority, 'medium'),
+       COALESCE(is_voice, FALSE),
+       COUNT(*)
+FROM ideas
+GROUP BY 1, 2, 3;
+
 -- Create a function to automatically update the updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
     RETURNS TRIGGER AS $$
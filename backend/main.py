@@ -1,16 +1,28 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text, Enum
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import MultipartParser, parse_options_header
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Date, Boolean, Text, Enum, func, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, date, timedelta, timezone
 from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
 import os
 from dotenv import load_dotenv
+import asyncio
 import enum
+import glob
 import logging
+import multiprocessing
+import re
+import sys
+import uuid
 import psycopg2
+from transcription import resolve_transcriber, transcribe_voice_note
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -44,6 +56,20 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+# Voice Upload Configuration
+# Relative paths are resolved against this directory, not the process's working directory
+VOICE_UPLOAD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.getenv("VOICE_UPLOAD_DIR", "uploads/voice"))
+VOICE_MAX_UPLOAD_BYTES = int(os.getenv("VOICE_MAX_UPLOAD_BYTES", 25 * 1024 * 1024))
+VOICE_MAX_FIELD_BYTES = 1024  # Limit for form fields and part headers, which are held in memory
+VOICE_MAX_PARTS = 16
+VOICE_MAX_PART_HEADERS = 8
+VOICE_PENDING_CONTENT = "[Voice note - transcription pending]"
+VOICE_FAILED_CONTENT = "[Voice note - transcription failed]"
+TRANSCRIBER = os.getenv("TRANSCRIBER", "stub")
+TRANSCRIPTION_WORKERS = int(os.getenv("TRANSCRIPTION_WORKERS", 2))
+# A pending voice note untouched for this long is assumed lost and requeued; keep it above the slowest transcription
+VOICE_TRANSCRIPTION_LEASE_SECONDS = int(os.getenv("VOICE_TRANSCRIPTION_LEASE_SECONDS", 600))
+
 # Priority Enum
 class PriorityEnum(str, enum.Enum):
     high = "high"
@@ -62,17 +88,92 @@ class IdeaDB(Base):
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, index=True)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class IdeaDailyStatsDB(Base):
+    """Per-day idea counts, bucketed by priority and voice/text, kept in step with the ideas table"""
+    __tablename__ = "idea_daily_stats"
+
+    day = Column(Date, primary_key=True)
+    priority = Column(Enum(PriorityEnum, name="priority_enum", create_type=False), primary_key=True)
+    is_voice = Column(Boolean, primary_key=True)
+    idea_count = Column(Integer, nullable=False, default=0)
+
+# Rollup helpers - idea_daily_stats is updated in the same transaction as the idea itself
+def rollup_day(created_at: Optional[datetime]) -> date:
+    """Return the UTC calendar day an idea is counted under"""
+    if created_at is None:
+        created_at = datetime.now(timezone.utc)
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return created_at.date()
+
+def bump_rollup(db: Session, day: date, priority: Optional[PriorityEnum], is_voice: Optional[bool], delta: int):
+    """Atomically add delta to the rollup row for (day, priority, is_voice)"""
+    stmt = pg_insert(IdeaDailyStatsDB).values(
+        day=day,
+        priority=priority or PriorityEnum.medium,
+        is_voice=bool(is_voice),
+        idea_count=delta
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[IdeaDailyStatsDB.day, IdeaDailyStatsDB.priority, IdeaDailyStatsDB.is_voice],
+        set_={"idea_count": IdeaDailyStatsDB.idea_count + delta}
+    )
+    db.execute(stmt)
+
+def rebuild_rollups(db: Session, start: Optional[date] = None, end: Optional[date] = None) -> int:
+    """Recompute rollup rows from the ideas table, optionally limited to [start, end]"""
+    # Block concurrent bump_rollup upserts (reads still work) until this transaction
+    # commits, so they can neither be wiped out nor collide with the re-inserted rows
+    db.execute(text("LOCK TABLE idea_daily_stats IN EXCLUSIVE MODE"))
+
+    day_col = func.date(func.timezone("UTC", IdeaDB.created_at))
+    query = db.query(day_col, IdeaDB.priority, IdeaDB.is_voice, func.count(IdeaDB.id))
+    stale = db.query(IdeaDailyStatsDB)
+
+    if start:
+        query = query.filter(IdeaDB.created_at >= datetime.combine(start, datetime.min.time(), timezone.utc))
+        stale = stale.filter(IdeaDailyStatsDB.day >= start)
+    if end:
+        query = query.filter(IdeaDB.created_at < datetime.combine(end + timedelta(days=1), datetime.min.time(), timezone.utc))
+        stale = stale.filter(IdeaDailyStatsDB.day <= end)
+
+    # NULL priority/is_voice fall back to the column defaults, so merge them into those buckets
+    counts = {}
+    for day, priority, is_voice, count in query.group_by(day_col, IdeaDB.priority, IdeaDB.is_voice).all():
+        key = (day, priority or PriorityEnum.medium, bool(is_voice))
+        counts[key] = counts.get(key, 0) + count
+
+    stale.delete(synchronize_session=False)
+    db.add_all([
+        IdeaDailyStatsDB(day=day, priority=priority, is_voice=is_voice, idea_count=count)
+        for (day, priority, is_voice), count in counts.items()
+    ])
+    return len(counts)
+
 # Don't try to create the priority_enum type as it should already exist in the database
 # Just check if tables exist and create them if they don't
 try:
     # Check if the table exists before trying to create it
     conn = engine.connect()
-    if not engine.dialect.has_table(conn, "ideas"):
+    rollups_missing = not engine.dialect.has_table(conn, IdeaDailyStatsDB.__tablename__)
+    if not all(engine.dialect.has_table(conn, table) for table in Base.metadata.tables):
+        # create_all only creates the tables that are missing
         Base.metadata.create_all(bind=engine)
         logger.info("Database tables created successfully")
     else:
         logger.info("Tables already exist, skipping creation")
     conn.close()
+
+    # A freshly created rollup table must reflect existing ideas before the first
+    # incremental update, or old history reads as zero and deletes go negative
+    if rollups_missing:
+        db = SessionLocal()
+        try:
+            rollup_rows = rebuild_rollups(db)
+            db.commit()
+            logger.info(f"Backfilled {rollup_rows} rollup rows from existing ideas")
+        finally:
+            db.close()
 except Exception as e:
     logger.error(f"Error checking/creating database tables: {e}")
     raise
@@ -100,6 +201,13 @@ class IdeaResponse(BaseModel):
     class Config:
         from_attributes = True
 
+TIMELINE_MAX_BUCKETS = 1000  # Upper bound on the number of periods returned by /stats/timeline
+
+class TimelineBucket(str, enum.Enum):
+    day = "day"
+    week = "week"
+    month = "month"
+
 # FastAPI App
 app = FastAPI(
     title="Ideas Jar API",
@@ -116,6 +224,22 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def start_transcription_sweeper():
+    """Check the transcriber and start requeueing transcriptions lost to a restart or crash"""
+    global transcription_sweeper
+    resolve_transcriber(TRANSCRIBER)
+    transcription_sweeper = asyncio.create_task(requeue_stale_transcriptions())
+
+@app.on_event("shutdown")
+def shutdown_transcription_pool():
+    global transcription_pool
+    if transcription_sweeper is not None:
+        transcription_sweeper.cancel()
+    if transcription_pool is not None:
+        transcription_pool.shutdown(wait=False, cancel_futures=True)
+        transcription_pool = None
+
 # Dependency to get database session
 def get_db():
     db = SessionLocal()
@@ -124,6 +248,236 @@ def get_db():
     finally:
         db.close()
 
+# Voice upload helpers
+class VoiceUploadStream:
+    """Streams a multipart/form-data voice upload to disk as it arrives
+
+    Audio is written out after every network chunk, so at most one chunk of it is
+    held in memory. Form fields and part headers are capped at VOICE_MAX_FIELD_BYTES each,
+    and the number of parts and headers per part are capped too.
+    """
+
+    def __init__(self, boundary: bytes, dest_path: str):
+        self.dest_path = dest_path
+        self.fields = {}
+        self.audio_bytes = 0
+        self.audio_filename = None
+        self._part_count = 0
+        self._headers = {}
+        self._header_field = b""
+        self._header_value = b""
+        self._part_name = None
+        self._part_is_audio = False
+        self._field_value = b""
+        self._pending = []
+        self._parser = MultipartParser(boundary, callbacks={
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+
+    async def consume(self, request: Request):
+        """Read the request body chunk by chunk, writing audio to dest_path"""
+        audio_file = await run_in_threadpool(open, self.dest_path, "wb")
+        try:
+            async for chunk in request.stream():
+                self._parser.write(chunk)
+                for data in self._pending:
+                    await run_in_threadpool(audio_file.write, data)
+                self._pending.clear()
+            self._parser.finalize()
+        except MultipartParseError as e:
+            raise HTTPException(status_code=400, detail=f"Malformed multipart upload: {str(e)}")
+        finally:
+            await run_in_threadpool(audio_file.close)
+
+    def _on_part_begin(self):
+        self._part_count += 1
+        if self._part_count > VOICE_MAX_PARTS:
+            raise HTTPException(status_code=400, detail="Too many form fields")
+        self._headers = {}
+        self._part_name = None
+        self._part_is_audio = False
+        self._field_value = b""
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_field += data[start:end]
+        if len(self._header_field) > VOICE_MAX_FIELD_BYTES:
+            raise HTTPException(status_code=400, detail="Multipart header too large")
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+        if len(self._header_value) > VOICE_MAX_FIELD_BYTES:
+            raise HTTPException(status_code=400, detail="Multipart header too large")
+
+    def _on_header_end(self):
+        if len(self._headers) >= VOICE_MAX_PART_HEADERS:
+            raise HTTPException(status_code=400, detail="Too many multipart headers")
+        self._headers[self._header_field.lower()] = self._header_value
+        self._header_field = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._part_name = options.get(b"name", b"").decode("utf-8", "replace")
+        if b"filename" not in options:
+            return
+
+        if self._part_name != "audio" or self.audio_filename is not None:
+            raise HTTPException(status_code=400, detail="Expected a single file field named 'audio'")
+        content_type = self._headers.get(b"content-type", b"application/octet-stream")
+        if not content_type.lower().startswith(b"audio/"):
+            raise HTTPException(status_code=415, detail="Voice notes must be uploaded as audio/*")
+        self._part_is_audio = True
+        self.audio_filename = options[b"filename"].decode("utf-8", "replace")
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if self._part_is_audio:
+            self.audio_bytes += end - start
+            if self.audio_bytes > VOICE_MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="Voice note is too large")
+            self._pending.append(data[start:end])
+        else:
+            self._field_value += data[start:end]
+            if len(self._field_value) > VOICE_MAX_FIELD_BYTES:
+                raise HTTPException(status_code=400, detail=f"Form field '{self._part_name}' is too large")
+
+    def _on_part_end(self):
+        if not self._part_is_audio:
+            self.fields[self._part_name] = self._field_value.decode("utf-8", "replace")
+
+def voice_audio_path(idea_id: int, filename: Optional[str]) -> str:
+    """Return where the audio for an idea is stored, keeping a safe file extension"""
+    ext = os.path.splitext(filename or "")[1].lower()
+    if not re.fullmatch(r"\.[a-z0-9]{1,8}", ext):
+        ext = ".audio"
+    return os.path.join(VOICE_UPLOAD_DIR, f"{idea_id}{ext}")
+
+def remove_voice_audio(idea_id: int):
+    for path in glob.glob(os.path.join(VOICE_UPLOAD_DIR, f"{idea_id}.*")):
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.warning(f"Could not remove voice note {path}: {e}")
+
+# Transcription runs in separate processes so CPU-heavy speech recognition
+# never blocks the event loop. Workers are spawned rather than forked so they
+# don't inherit the parent's database connections; spawned workers re-import
+# the __main__ script, so start the app via uvicorn (see the bottom of this file).
+transcription_pool: Optional[ProcessPoolExecutor] = None
+transcription_sweeper: Optional[asyncio.Task] = None
+requeued_transcriptions = set()
+
+def get_transcription_pool() -> ProcessPoolExecutor:
+    global transcription_pool
+    if transcription_pool is None:
+        transcription_pool = ProcessPoolExecutor(
+            max_workers=TRANSCRIPTION_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return transcription_pool
+
+async def transcribe_voice_idea(idea_id: int, audio_path: str):
+    """Transcribe a voice note in the process pool and store the text as the idea content"""
+    # Cancellation on shutdown is not caught here, so the idea stays pending and is requeued once its lease expires
+    loop = asyncio.get_running_loop()
+    try:
+        transcript = await loop.run_in_executor(get_transcription_pool(), transcribe_voice_note, audio_path, TRANSCRIBER)
+    except Exception as e:
+        logger.error(f"Error transcribing voice note for idea {idea_id}: {e}")
+        transcript = None
+
+    if not transcript:
+        logger.warning(f"Transcription for idea {idea_id} failed or was empty")
+        transcript = VOICE_FAILED_CONTENT
+
+    save_transcription(idea_id, transcript)
+
+def claim_stale_transcriptions() -> List[int]:
+    """Claim voice ideas left pending for longer than the lease and return their ids
+
+    The claim is a conditional UPDATE that bumps updated_at, so when several workers or
+    instances sweep at once each pending idea is claimed by exactly one of them.
+    """
+    now = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        claimed = db.execute(
+            update(IdeaDB)
+            .where(
+                IdeaDB.is_voice == True,
+                IdeaDB.content == VOICE_PENDING_CONTENT,
+                IdeaDB.updated_at < now - timedelta(seconds=VOICE_TRANSCRIPTION_LEASE_SECONDS)
+            )
+            .values(updated_at=now)
+            .returning(IdeaDB.id)
+        ).scalars().all()
+        db.commit()
+        return claimed
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error claiming pending transcriptions: {e}")
+        return []
+    finally:
+        db.close()
+
+async def requeue_stale_transcriptions():
+    """Periodically requeue claimed voice notes, or mark them failed if their audio is gone"""
+    while True:
+        for idea_id in claim_stale_transcriptions():
+            audio_paths = glob.glob(os.path.join(VOICE_UPLOAD_DIR, f"{idea_id}.*"))
+            if audio_paths:
+                logger.info(f"Requeueing transcription for idea {idea_id}")
+                task = asyncio.create_task(transcribe_voice_idea(idea_id, audio_paths[0]))
+                requeued_transcriptions.add(task)
+                task.add_done_callback(requeued_transcriptions.discard)
+            else:
+                logger.warning(f"Voice note audio for idea {idea_id} is missing")
+                save_transcription(idea_id, VOICE_FAILED_CONTENT)
+        await asyncio.sleep(VOICE_TRANSCRIPTION_LEASE_SECONDS)
+
+def save_transcription(idea_id: int, content: str):
+    """Replace the placeholder content of a voice idea, unless it was edited or deleted meanwhile"""
+    db = SessionLocal()
+    try:
+        db.query(IdeaDB).filter(
+            IdeaDB.id == idea_id,
+            IdeaDB.content == VOICE_PENDING_CONTENT
+        ).update({"content": content, "updated_at": datetime.utcnow()}, synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error saving transcription for idea {idea_id}: {e}")
+    finally:
+        db.close()
+
+def bucket_start(day: date, bucket: TimelineBucket) -> date:
+    """Return the first day of the bucket containing day (weeks start on Monday)"""
+    if bucket == TimelineBucket.week:
+        return day - timedelta(days=day.weekday())
+    if bucket == TimelineBucket.month:
+        return day.replace(day=1)
+    return day
+
+def bucket_count(start: date, end: date, bucket: TimelineBucket) -> int:
+    """Return how many buckets the range [start, end] spans"""
+    if bucket == TimelineBucket.week:
+        return (bucket_start(end, bucket) - bucket_start(start, bucket)).days // 7 + 1
+    if bucket == TimelineBucket.month:
+        return (end.year - start.year) * 12 + end.month - start.month + 1
+    return (end - start).days + 1
+
+def next_bucket_start(start: date, bucket: TimelineBucket) -> date:
+    if bucket == TimelineBucket.week:
+        return start + timedelta(days=7)
+    if bucket == TimelineBucket.month:
+        return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return start + timedelta(days=1)
+
 # API Routes
 @app.get("/")
 async def root():
@@ -210,9 +564,12 @@ async def create_idea(idea: IdeaCreate, db: Session = Depends(get_db)):
         db_idea = IdeaDB(
             content=idea.content.strip(),
             is_voice=idea.is_voice,
-            priority=idea.priority
+            priority=idea.priority,
+            created_at=datetime.now(timezone.utc)
         )
         db.add(db_idea)
+        db.flush()
+        bump_rollup(db, rollup_day(db_idea.created_at), db_idea.priority, db_idea.is_voice, 1)
         db.commit()
         db.refresh(db_idea)
         return db_idea
@@ -221,17 +578,80 @@ async def create_idea(idea: IdeaCreate, db: Session = Depends(get_db)):
         logger.error(f"Error creating idea: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+@app.post("/ideas/voice", response_model=IdeaResponse)
+async def create_voice_idea(request: Request, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    """Create a voice idea from an uploaded audio file; its content is filled in once transcribed"""
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type.lower().strip() != b"multipart/form-data" or not params.get(b"boundary"):
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+
+    # Reject obviously oversized uploads before reading anything; the streaming
+    # parser still enforces the limit for chunked or mislabelled requests
+    content_length = request.headers.get("content-length", "")
+    max_overhead = VOICE_MAX_PARTS * (2 * VOICE_MAX_PART_HEADERS + 1) * VOICE_MAX_FIELD_BYTES
+    if content_length.isdigit() and int(content_length) > VOICE_MAX_UPLOAD_BYTES + max_overhead:
+        raise HTTPException(status_code=413, detail="Voice note is too large")
+
+    os.makedirs(VOICE_UPLOAD_DIR, exist_ok=True)
+    upload_path = os.path.join(VOICE_UPLOAD_DIR, f"{uuid.uuid4().hex}.part")
+    upload = VoiceUploadStream(params[b"boundary"], upload_path)
+    try:
+        await upload.consume(request)
+        if upload.audio_filename is None or upload.audio_bytes == 0:
+            raise HTTPException(status_code=400, detail="Voice note audio cannot be empty")
+        try:
+            priority = PriorityEnum(upload.fields.get("priority", PriorityEnum.medium.value))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Priority must be one of: high, medium, low")
+    except Exception:
+        if os.path.exists(upload_path):
+            os.remove(upload_path)
+        raise
+
+    audio_path = None
+    try:
+        db_idea = IdeaDB(
+            content=VOICE_PENDING_CONTENT,
+            is_voice=True,
+            priority=priority,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc)  # Starts the transcription lease
+        )
+        db.add(db_idea)
+        db.flush()
+        bump_rollup(db, rollup_day(db_idea.created_at), db_idea.priority, db_idea.is_voice, 1)
+        audio_path = voice_audio_path(db_idea.id, upload.audio_filename)
+        os.replace(upload_path, audio_path)
+        db.commit()
+        db.refresh(db_idea)
+    except Exception as e:
+        db.rollback()
+        for path in (upload_path, audio_path):
+            if path and os.path.exists(path):
+                os.remove(path)
+        logger.error(f"Error creating voice idea: {e}")
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+    background_tasks.add_task(transcribe_voice_idea, db_idea.id, audio_path)
+    return db_idea
+
 @app.put("/ideas/{idea_id}", response_model=IdeaResponse)
 async def update_idea(idea_id: int, idea: IdeaUpdate, db: Session = Depends(get_db)):
     """Update an existing idea"""
-    db_idea = db.query(IdeaDB).filter(IdeaDB.id == idea_id).first()
-    if not db_idea:
-        raise HTTPException(status_code=404, detail="Idea not found")
-
     if not idea.content.strip():
         raise HTTPException(status_code=400, detail="Idea content cannot be empty")
 
+    # Lock the row so concurrent updates compute their rollup deltas from the latest values
+    db_idea = db.query(IdeaDB).filter(IdeaDB.id == idea_id).with_for_update().first()
+    if not db_idea:
+        raise HTTPException(status_code=404, detail="Idea not found")
+
     try:
+        if db_idea.priority != idea.priority or bool(db_idea.is_voice) != idea.is_voice:
+            day = rollup_day(db_idea.created_at)
+            bump_rollup(db, day, db_idea.priority, db_idea.is_voice, -1)
+            bump_rollup(db, day, idea.priority, idea.is_voice, 1)
+
         db_idea.content = idea.content.strip()
         db_idea.is_voice = idea.is_voice
         db_idea.priority = idea.priority
@@ -248,13 +668,16 @@ async def update_idea(idea_id: int, idea: IdeaUpdate, db: Session = Depends(get_
 @app.delete("/ideas/{idea_id}")
 async def delete_idea(idea_id: int, db: Session = Depends(get_db)):
     """Delete an idea"""
-    db_idea = db.query(IdeaDB).filter(IdeaDB.id == idea_id).first()
+    # Lock the row so a concurrent delete of the same idea finds it gone and never decrements twice
+    db_idea = db.query(IdeaDB).filter(IdeaDB.id == idea_id).with_for_update().first()
     if not db_idea:
         raise HTTPException(status_code=404, detail="Idea not found")
 
     try:
+        bump_rollup(db, rollup_day(db_idea.created_at), db_idea.priority, db_idea.is_voice, -1)
         db.delete(db_idea)
         db.commit()
+        remove_voice_audio(idea_id)
         return {"message": "Idea deleted successfully"}
     except Exception as e:
         db.rollback()
@@ -302,6 +725,94 @@ async def get_stats(db: Session = Depends(get_db)):
         logger.error(f"Error getting stats: {e}")
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
 
+@app.get("/stats/timeline")
+async def get_stats_timeline(
+        start: Optional[date] = Query(None, alias="from"),
+        end: Optional[date] = Query(None, alias="to"),
+        bucket: TimelineBucket = TimelineBucket.day,
+        db: Session = Depends(get_db)
+):
+    """Get idea counts per day, week or month, read from the daily rollups"""
+    end = end or datetime.utcnow().date()
+    if start is None:
+        start = end - timedelta(days=29) if end > date.min + timedelta(days=29) else date.min
+    if start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+    if bucket_count(start, end, bucket) > TIMELINE_MAX_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range spans more than {TIMELINE_MAX_BUCKETS} {bucket.value} buckets; use a larger bucket or a shorter range"
+        )
+
+    # Widen the range to whole buckets so the first and last periods are not partial
+    start = bucket_start(start, bucket)
+    try:
+        end = next_bucket_start(bucket_start(end, bucket), bucket) - timedelta(days=1)
+    except OverflowError:
+        end = date.max
+
+    try:
+        rows = db.query(IdeaDailyStatsDB).filter(
+            IdeaDailyStatsDB.day >= start,
+            IdeaDailyStatsDB.day <= end
+        ).all()
+    except Exception as e:
+        logger.error(f"Error getting stats timeline: {e}")
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+    # Zero-fill every bucket in the range so charts get a continuous series
+    series = {}
+    period = start
+    while period <= end:
+        series[period] = {
+            "period_start": period,
+            "total_ideas": 0,
+            "voice_ideas": 0,
+            "text_ideas": 0,
+            "priority_breakdown": {p.value: 0 for p in PriorityEnum}
+        }
+        try:
+            period = next_bucket_start(period, bucket)
+        except OverflowError:
+            break  # The last bucket ends at date.max
+
+    for row in rows:
+        entry = series[bucket_start(row.day, bucket)]
+        entry["total_ideas"] += row.idea_count
+        entry["voice_ideas" if row.is_voice else "text_ideas"] += row.idea_count
+        entry["priority_breakdown"][row.priority.value] += row.idea_count
+
+    return {
+        "from": start,
+        "to": end,
+        "bucket": bucket,
+        "series": list(series.values())
+    }
+
+@app.post("/stats/rollups/rebuild")
+async def rebuild_stats_rollups(
+        start: Optional[date] = Query(None, alias="from"),
+        end: Optional[date] = Query(None, alias="to"),
+        db: Session = Depends(get_db)
+):
+    """Backfill the daily rollups from existing ideas, optionally for a date range only"""
+    if start and end and start > end:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'")
+
+    try:
+        rollup_rows = rebuild_rollups(db, start, end)
+        db.commit()
+        return {"message": "Rollups rebuilt successfully", "rollup_rows": rollup_rows}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error rebuilding rollups: {e}")
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Hand over to `python -m uvicorn main:app` rather than serving from this script:
+    # spawned transcription workers would otherwise re-run this file, database setup included
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    os.execv(sys.executable, [
+        sys.executable, "-m", "uvicorn", "main:app",
+        "--app-dir", app_dir, "--host", "0.0.0.0", "--port", "8000"
+    ])
\ No newline at end of file
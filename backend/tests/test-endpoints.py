@@ -102,6 +102,20 @@ def test_create_idea():
     # Return the created idea IDs for later tests
     return response.json()["id"], response_voice.json()["id"]
 
+def test_create_voice_idea():
+    """Test creating an idea from a voice note upload"""
+    endpoint = "/ideas/voice"
+    files = {"audio": ("test-note.webm", b"\x1a\x45\xdf\xa3" + b"\x00" * 4096, "audio/webm")}
+    response = requests.post(f"{BASE_URL}{endpoint}", files=files, data={"priority": "high"})
+    print_response(response, endpoint)
+
+    # Give the background transcription a moment, then check the content was filled in
+    time.sleep(2)
+    idea_id = response.json()["id"]
+    test_get_idea(idea_id)
+
+    return idea_id
+
 def test_get_idea(idea_id):
     """Test getting a specific idea by ID"""
     endpoint = f"/ideas/{idea_id}"
@@ -133,6 +147,27 @@ def test_stats():
     response = requests.get(f"{BASE_URL}{endpoint}")
     print_response(response, endpoint)
 
+def test_stats_timeline():
+    """Test getting the statistics timeline"""
+    endpoint = "/stats/timeline"
+    response = requests.get(f"{BASE_URL}{endpoint}")
+    print_response(response, endpoint)
+
+    # Test weekly and monthly buckets over an explicit range
+    endpoint = "/stats/timeline?from=2025-01-01&to=2025-03-31&bucket=week"
+    response = requests.get(f"{BASE_URL}{endpoint}")
+    print_response(response, endpoint)
+
+    endpoint = "/stats/timeline?from=2025-01-01&to=2025-12-31&bucket=month"
+    response = requests.get(f"{BASE_URL}{endpoint}")
+    print_response(response, endpoint)
+
+def test_rebuild_rollups():
+    """Test backfilling the daily rollups"""
+    endpoint = "/stats/rollups/rebuild"
+    response = requests.post(f"{BASE_URL}{endpoint}")
+    print_response(response, endpoint)
+
 def test_delete_idea(idea_id):
     """Test deleting an idea"""
     endpoint = f"/ideas/{idea_id}"
@@ -156,6 +191,17 @@ def test_error_cases():
     response = requests.get(f"{BASE_URL}{endpoint}")
     print_response(response, endpoint)
 
+    # Test inverted timeline range
+    endpoint = "/stats/timeline?from=2025-02-01&to=2025-01-01"
+    response = requests.get(f"{BASE_URL}{endpoint}")
+    print_response(response, endpoint)
+
+    # Test voice upload with a non-audio file
+    endpoint = "/ideas/voice"
+    files = {"audio": ("notes.txt", b"not audio", "text/plain")}
+    response = requests.post(f"{BASE_URL}{endpoint}", files=files)
+    print_response(response, endpoint)
+
 def run_all_tests():
     """Run all tests in sequence"""
     logger.info("Starting API endpoint tests...")
@@ -170,6 +216,7 @@ def run_all_tests():
 
         # Test creating ideas and get their IDs
         idea_id, voice_idea_id = test_create_idea()
+        uploaded_voice_idea_id = test_create_voice_idea()
 
         # Test operations on individual ideas
         test_get_idea(idea_id)
@@ -179,6 +226,8 @@ def run_all_tests():
         # Test search and stats
         test_search_ideas()
         test_stats()
+        test_rebuild_rollups()
+        test_stats_timeline()
 
         # Test error cases
         test_error_cases()
@@ -186,6 +235,7 @@ def run_all_tests():
         # Test deleting ideas (cleanup)
         test_delete_idea(idea_id)
         test_delete_idea(voice_idea_id)
+        test_delete_idea(uploaded_voice_idea_id)
 
         logger.info("All tests completed successfully!")
 
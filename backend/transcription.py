@@ -0,0 +1,73 @@
+"""
+transcription.py - Voice note transcription for Ideas Jar
+
+Everything here runs inside the transcription process pool, so this module
+must stay importable without main.py (which connects to the database).
+
+Transcribers are selected with the TRANSCRIBER environment variable, either
+by a name registered in TRANSCRIBERS or as "package.module:ClassName".
+"""
+
+import importlib
+import inspect
+import os
+import re
+from abc import ABC, abstractmethod
+
+
+class Transcriber(ABC):
+    """Base class for transcribers - subclasses turn an audio file into text"""
+
+    @abstractmethod
+    def transcribe(self, audio_path: str) -> str:
+        ...
+
+
+class StubTranscriber(Transcriber):
+    """Offline transcriber that describes the recording instead of recognising speech"""
+
+    def transcribe(self, audio_path: str) -> str:
+        size_kb = os.path.getsize(audio_path) / 1024
+        return f"Voice note ({size_kb:.1f} KB) - no speech recognition configured"
+
+
+TRANSCRIBERS = {
+    "stub": StubTranscriber,
+}
+
+
+def resolve_transcriber(name: str) -> type:
+    """Look up a registered transcriber or one given as "package.module:ClassName"
+
+    Raises if the class is not a concrete Transcriber, so a misconfigured
+    TRANSCRIBER can be caught at startup instead of inside a worker.
+    """
+    if name in TRANSCRIBERS:
+        cls = TRANSCRIBERS[name]
+    else:
+        module_name, _, class_name = name.partition(":")
+        if not class_name:
+            raise ValueError(f"Unknown transcriber: {name}")
+        cls = getattr(importlib.import_module(module_name), class_name)
+
+    if not (inspect.isclass(cls) and issubclass(cls, Transcriber)):
+        raise TypeError(f"Transcriber {name} is not a Transcriber subclass")
+    if inspect.isabstract(cls):
+        raise TypeError(f"Transcriber {name} does not implement transcribe()")
+    return cls
+
+
+def load_transcriber(name: str) -> Transcriber:
+    """Instantiate the transcriber named by resolve_transcriber"""
+    return resolve_transcriber(name)()
+
+
+def normalize_transcript(text: str) -> str:
+    """Collapse whitespace and capitalize the first letter of a transcript"""
+    text = re.sub(r"\s+", " ", text).strip()
+    return text[:1].upper() + text[1:]
+
+
+def transcribe_voice_note(audio_path: str, transcriber_name: str) -> str:
+    """Transcribe and normalize a voice note (entry point for the process pool)"""
+    return normalize_transcript(load_transcriber(transcriber_name).transcribe(audio_path))